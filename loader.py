@@ -1,7 +1,23 @@
+import copy
+import functools
 import os
+import re
+import stat
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+_BOOL_VALUES = {"true": True, "false": False}
+# int()/float() only succeed on strings containing a digit, apart from the
+# special float spellings below; checking first avoids raising for plain text.
+_HAS_DIGIT = re.compile(r"\d").search
+_FLOAT_SPECIALS = frozenset({"inf", "infinity", "nan"})
 
 
 class ConfigLoader:
@@ -28,6 +44,9 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration directory not found: {config_dir}")
         self.config_dir = config_dir
         self.env_prefix = f"{env_prefix}_"
+        self._env_prefix_len = len(self.env_prefix)
+        # Parsed YAML files keyed by path, invalidated on mtime/size change.
+        self._yaml_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
 
     def load(self, env: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -49,57 +68,91 @@ class ConfigLoader:
         # 2. Load environment-specific configuration and merge
         env_config_path = self.config_dir / f"{env}.yaml"
         env_config = self._load_yaml_file(env_config_path)
-        merged_config = self._deep_merge(base_config, env_config)
+        self._deep_merge_inplace(base_config, env_config)
 
         # 3. Load from environment variables and merge
         env_vars_config = self._load_from_env()
-        final_config = self._deep_merge(merged_config, env_vars_config)
+        self._deep_merge_inplace(base_config, env_vars_config)
 
-        return final_config
+        return base_config
 
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
-        """Loads a YAML file if it exists, otherwise returns an empty dict."""
-        if not file_path.is_file():
+        """
+        Loads a YAML file if it exists, otherwise returns an empty dict.
+
+        Parsed files are cached and reused until their modification time or
+        size changes. Callers always receive a private deep copy.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
             return {}
-        with open(file_path, "r") as f:
+        if not stat.S_ISREG(st.st_mode):
+            return {}
+
+        cached = self._yaml_cache.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+
+        with open(file_path, "rb") as f:
             try:
-                data = yaml.safe_load(f)
-                return data if isinstance(data, dict) else {}
+                data = yaml.load(f, Loader=_SafeLoader)
             except yaml.YAMLError:
-                return {}
-
-    def _deep_merge(self, base: Dict, override: Dict) -> Dict:
-        """Recursively merges two dictionaries."""
-        merged = base.copy()
-        for key, value in override.items():
-            if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
-                merged[key] = self._deep_merge(merged[key], value)
-            else:
-                merged[key] = value
-        return merged
+                data = None
+        data = data if isinstance(data, dict) else {}
+        self._yaml_cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
+
+    def _deep_merge_inplace(self, base: Dict, override: Dict) -> None:
+        """
+        Merges `override` into `base` in place, descending into nested dicts.
+
+        Nested dicts are copied before being modified, since YAML aliases can make
+        several keys share one dict and an override must only affect its own key.
+        """
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    child = dst[key] = dict(dst[key])
+                    stack.append((child, value))
+                else:
+                    dst[key] = value
 
     def _load_from_env(self) -> Dict[str, Any]:
         """Loads and parses configuration from environment variables."""
+        prefix = self.env_prefix
+        items = [(k, v) for k, v in os.environ.items() if k.startswith(prefix)]
+        if not items:
+            return {}
+
+        plen = self._env_prefix_len
         config = {}
-        for key, value in os.environ.items():
-            if key.startswith(self.env_prefix):
-                # Remove prefix and split by double underscore for nesting
-                path = key[len(self.env_prefix):].lower().split("__")
-                
-                parsed_value = self._parse_value(value)
-
-                d = config
-                for part in path[:-1]:
-                    if part not in d:
-                        d[part] = {}
-                    d = d[part]
-                d[path[-1]] = parsed_value
+        for key, value in items:
+            # Remove prefix and split by double underscore for nesting
+            path = [part.lower() for part in key[plen:].split("__")]
+
+            parsed_value = self._parse_value(value)
+
+            d = config
+            for part in path[:-1]:
+                if part not in d:
+                    d[part] = {}
+                d = d[part]
+            d[path[-1]] = parsed_value
         return config
 
-    def _parse_value(self, value: str) -> Any:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_value(value: str) -> Any:
         """Attempts to convert string value to int, float, or bool."""
-        if value.lower() in ("true", "false"):
-            return value.lower() == "true"
+        if len(value) <= 5:
+            parsed = _BOOL_VALUES.get(value.lower())
+            if parsed is not None:
+                return parsed
+        if not _HAS_DIGIT(value) and value.strip().lstrip("+-").lower() not in _FLOAT_SPECIALS:
+            return value
         try:
             return int(value)
         except ValueError:
@@ -1,16 +1,30 @@
 import os
+import signal
 import time
+import asyncio
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 
-from web3 import Web3
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
 from web3.contract import Contract
 from web3.middleware import geth_poa_middleware
 from web3.exceptions import BlockNotFound
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -20,6 +34,7 @@ CONFIG = {
     "source_chain": {
         "name": "Sepolia",
         "rpc_url": os.getenv("SEPOLIA_RPC_URL", "https://rpc.sepolia.org"),
+        "wss_url": os.getenv("SEPOLIA_WSS_URL"), # Optional: enables push-based log subscriptions instead of polling
         "bridge_contract_address": "0x1234567890123456789012345678901234567890", # Placeholder address
         "start_block": 1000000 # Block to start scanning from if no state file is found
     },
@@ -41,15 +56,14 @@ CONFIG = {
 
 # --- Contract ABI (Simplified) --- #
 # This is a simplified ABI for demonstration purposes.
-BRIDGE_CONTRACT_ABI = json.loads('''
-[
+BRIDGE_CONTRACT_ABI: List[Dict[str, Any]] = [
     {
-        "anonymous": false,
+        "anonymous": False,
         "inputs": [
-            {"indexed": true, "name": "from", "type": "address"},
-            {"indexed": true, "name": "toChainId", "type": "uint256"},
-            {"indexed": false, "name": "amount", "type": "uint256"},
-            {"indexed": false, "name": "nonce", "type": "uint256"}
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "toChainId", "type": "uint256"},
+            {"indexed": False, "name": "amount", "type": "uint256"},
+            {"indexed": False, "name": "nonce", "type": "uint256"}
         ],
         "name": "TokensLocked",
         "type": "event"
@@ -66,7 +80,6 @@ BRIDGE_CONTRACT_ABI = json.loads('''
         "type": "function"
     }
 ]
-''')
 
 # --- Logging Configuration --- #
 logging.basicConfig(
@@ -92,6 +105,8 @@ class BlockchainConnector:
         """
         self.name = name
         self.rpc_url = rpc_url
+        # Only non-None while the last connection attempt succeeded; accessors rely on this
+        # instead of probing the node, leaving liveness checks to the caller's poll loop.
         self.web3: Optional[Web3] = None
         self.logger = logging.getLogger(f"BlockchainConnector.{self.name}")
         self.connect()
@@ -99,11 +114,12 @@ class BlockchainConnector:
     def connect(self):
         """Establishes a connection to the blockchain node."""
         try:
-            self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            w3 = Web3(Web3.HTTPProvider(self.rpc_url))
             # Middleware for PoA chains like Polygon Mumbai or Goerli
-            self.web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+            w3.middleware_onion.inject(geth_poa_middleware, layer=0)
             
-            if self.web3.is_connected():
+            if w3.is_connected():
+                self.web3 = w3
                 self.logger.info(f"Successfully connected to {self.name} at {self.rpc_url}")
             else:
                 raise ConnectionError(f"Failed to connect to {self.name}")
@@ -126,7 +142,7 @@ class BlockchainConnector:
         Returns:
             Optional[Contract]: A Web3 contract instance or None if not connected.
         """
-        if not self.is_connected() or not self.web3:
+        if self.web3 is None:
             self.logger.warning("Cannot get contract, not connected.")
             return None
         return self.web3.eth.contract(address=Web3.to_checksum_address(address), abi=abi)
@@ -138,7 +154,7 @@ class BlockchainConnector:
         Returns:
             Optional[int]: The latest block number or None on failure.
         """
-        if not self.is_connected() or not self.web3:
+        if self.web3 is None:
             self.logger.warning("Cannot get latest block, not connected.")
             return None
         try:
@@ -159,7 +175,26 @@ class EventListener:
         """
         self.config = config
         self.logger = logging.getLogger("EventListener")
-        self.state_file = config['listener_settings']['state_file']
+        # Read settings once so the poll loop doesn't repeat nested dict lookups
+        listener_settings = config['listener_settings']
+        self.state_file = listener_settings['state_file']
+        self._poll_interval = listener_settings['poll_interval_seconds']
+        self._batch_size = listener_settings['block_processing_batch_size']
+        self._start_block = config['source_chain']['start_block']
+        self._wss_url = config['source_chain'].get('wss_url')
+        # (monotonic timestamp, block number) of the last chain head lookup
+        self._cached_latest: Tuple[float, int] = (0.0, 0)
+        self._latest_refresh_interval = 60.0
+        # Scan window adapted to event density; starts at the configured batch size
+        self._current_batch = self._batch_size
+        self._max_batch = 10_000
+        self._min_batch = 10
+        self._dense_batch_events = 50
+        self._last_save_ts = 0.0
+        self._save_interval = 30.0
+        self._saved_state: Optional[Dict[str, Any]] = None
+        # Set on shutdown so a catch-up scan running in an executor thread stops between batches
+        self._stop = threading.Event()
 
         # Initialize source chain components
         source_chain_config = config['source_chain']
@@ -169,93 +204,277 @@ class EventListener:
             BRIDGE_CONTRACT_ABI
         )
 
+        # Precompute the log filter for 'TokensLocked' so each scan is a single eth_getLogs call
+        tokens_locked_abi = next(item for item in BRIDGE_CONTRACT_ABI if item.get('type') == 'event' and item['name'] == 'TokensLocked')
+        tokens_locked_signature = f"TokensLocked({','.join(i['type'] for i in tokens_locked_abi['inputs'])})"
+        self._topic0 = Web3.keccak(text=tokens_locked_signature).hex()
+        self._log_addr = Web3.to_checksum_address(source_chain_config['bridge_contract_address'])
+        self._tokens_locked_event = self.source_bridge_contract.events.TokensLocked() if self.source_bridge_contract else None
+
         # Initialize destination chain components for the processor
         self.event_processor = EventProcessor(config)
+        # Worker pool for batch processing. Building and signing are local today, so this only
+        # pays off once the (currently simulated) send_raw_transaction round-trip is enabled.
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="EventProcessor")
 
-        self.last_processed_block = self._load_state()
+        self.last_processed_block, self.last_processed_log = self._load_state()
 
-    def _load_state(self) -> int:
-        """Loads the last processed block number from the state file."""
+    def _load_state(self) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """
+        Loads the listener's position from the state file.
+
+        Returns:
+            Tuple[int, Optional[Tuple[int, int]]]: The last fully processed block number, and the
+                (blockNumber, logIndex) of the last individually handled log, if any.
+        """
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
-                last_block = int(state.get('last_processed_block', self.config['source_chain']['start_block']))
+            with open(self.state_file, 'rb') as f:
+                state = _json_loads(f.read())
+                last_block = int(state.get('last_processed_block', self._start_block))
+                last_log = state.get('last_processed_log')
+                last_log = (int(last_log[0]), int(last_log[1])) if last_log else None
                 self.logger.info(f"Loaded state: last processed block is {last_block}.")
-                return last_block
+                return last_block, last_log
         except (FileNotFoundError, json.JSONDecodeError):
-            self.logger.warning(f"State file not found or invalid. Starting from default start block: {self.config['source_chain']['start_block']}")
-            return self.config['source_chain']['start_block']
+            self.logger.warning(f"State file not found or invalid. Starting from default start block: {self._start_block}")
+            return self._start_block, None
 
-    def _save_state(self):
-        """Saves the last processed block number to the state file."""
-        with open(self.state_file, 'w') as f:
-            json.dump({'last_processed_block': self.last_processed_block}, f)
-            self.logger.debug(f"Saved state: last processed block is {self.last_processed_block}.")
+    def _save_state(self, force: bool = False):
+        """
+        Saves the last processed block number to the state file.
+
+        Writes are throttled to one every `_save_interval` seconds unless `force` is set,
+        which callers use whenever the listener goes idle, so throttling only coalesces
+        writes during catch-up. Unchanged state is never rewritten. Writes go through a
+        temporary file that is fsynced and then atomically swapped in, so a crash never
+        leaves a truncated state file.
+        """
+        state = {
+            'last_processed_block': self.last_processed_block,
+            'last_processed_log': self.last_processed_log
+        }
+        if state == self._saved_state:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_save_ts < self._save_interval:
+            return
+        tmp_file = self.state_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(state))
+            # Make the data durable before the rename, or a power loss could leave an empty file
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+        self._last_save_ts = now
+        self._saved_state = state
+        self.logger.debug("Saved state: last processed block is %d.", self.last_processed_block)
 
     def run(self):
-        """The main loop of the event listener."""
+        """
+        Runs the event listener until interrupted.
+
+        Uses a websocket log subscription when a `wss_url` is configured for the source
+        chain, and falls back to polling over HTTP otherwise.
+        """
         self.logger.info("Starting cross-chain event listener...")
+        # systemd and docker stop services with SIGTERM; treat it like Ctrl-C
+        previous_sigterm_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        try:
+            if self._wss_url and self._tokens_locked_event:
+                asyncio.run(self.run_async())
+            else:
+                self._run_polling()
+        except KeyboardInterrupt:
+            self.logger.info("Shutdown signal received. Exiting...")
+        finally:
+            signal.signal(signal.SIGTERM, previous_sigterm_handler)
+            # Also runs when the listener crashes, so progress since the last throttled save isn't lost
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._save_state(force=True)
+
+    def _handle_sigterm(self, signum: int, frame: Any):
+        """Routes SIGTERM into the same shutdown path as KeyboardInterrupt."""
+        self._stop.set()
+        raise KeyboardInterrupt
+
+    def _run_polling(self):
+        """The HTTP polling loop: periodically scans new blocks for events."""
         while True:
+            t0 = time.monotonic()
             try:
                 if not self.source_connector.is_connected():
                     self.logger.warning("Source chain disconnected. Attempting to reconnect...")
                     self.source_connector.connect()
-                    time.sleep(self.config['listener_settings']['poll_interval_seconds'])
+                    self._sleep_until_next_poll(t0)
                     continue
 
-                latest_block = self.source_connector.get_latest_block_number()
+                latest_block = self._get_latest_block()
                 if latest_block is None:
-                    time.sleep(self.config['listener_settings']['poll_interval_seconds'])
+                    self._sleep_until_next_poll(t0)
                     continue
 
-                # Determine the range of blocks to scan
-                from_block = self.last_processed_block + 1
-                to_block = min(latest_block, from_block + self.config['listener_settings']['block_processing_batch_size'] - 1)
-
-                if from_block > latest_block:
+                if self.last_processed_block >= latest_block:
                     self.logger.info(f"No new blocks to process. Current head: {latest_block}. Sleeping...")
+                    self._save_state(force=True)
                 else:
-                    self.logger.info(f"Scanning for 'TokensLocked' events from block {from_block} to {to_block}...")
-                    self._process_block_range(from_block, to_block)
-                    self.last_processed_block = to_block
-                    self._save_state()
+                    self._scan_next_range(latest_block)
 
-                time.sleep(self.config['listener_settings']['poll_interval_seconds'])
+                self._sleep_until_next_poll(t0)
 
-            except KeyboardInterrupt:
-                self.logger.info("Shutdown signal received. Exiting...")
-                break
             except Exception as e:
                 self.logger.error(f"An unexpected error occurred in the main loop: {e}", exc_info=True)
-                time.sleep(self.config['listener_settings']['poll_interval_seconds'] * 2) # Longer sleep on error
+                time.sleep(self._poll_interval * 2) # Longer sleep on error
+
+    def _get_latest_block(self) -> Optional[int]:
+        """
+        Returns the source chain head, reusing the last known value while catching up.
+
+        While the backlog behind the cached head still spans more than two batches, the
+        next batch will be full regardless of the exact head, so the head is only
+        refreshed every `_latest_refresh_interval` seconds. Once caught up, it is
+        fetched on every poll.
+        """
+        now = time.monotonic()
+        ts, cached_block = self._cached_latest
+        if cached_block - self.last_processed_block > self._current_batch * 2 and now - ts < self._latest_refresh_interval:
+            return cached_block
+        latest_block = self.source_connector.get_latest_block_number()
+        if latest_block is not None:
+            self._cached_latest = (now, latest_block)
+        return latest_block
+
+    async def run_async(self):
+        """
+        Listens for 'TokensLocked' logs pushed over a websocket subscription.
+
+        Blocks missed while offline are first scanned over HTTP. Reconnects after
+        `poll_interval_seconds` if the websocket drops.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self._wss_url)) as w3:
+                    # Subscribe before backfilling so no log falls between the two
+                    subscription_id = await w3.eth.subscribe("logs", {'address': self._log_addr, 'topics': [self._topic0]})
+                    self.logger.info(f"Subscribed to 'TokensLocked' logs via {self._wss_url}")
+                    try:
+                        await loop.run_in_executor(None, self._catch_up)
+                    except asyncio.CancelledError:
+                        # asyncio.run waits for executor threads on shutdown; let this one finish early
+                        self._stop.set()
+                        raise
+                    # web3 6.12 exposes pushed messages via listen_to_websocket()
+                    async for message in w3.ws.listen_to_websocket():
+                        if message.get('subscription') == subscription_id:
+                            await self._handle_log(message['result'])
+            except (AttributeError, TypeError):
+                # A programming or web3 API mismatch, not a dropped socket: reconnecting won't help
+                raise
+            except Exception as e:
+                self.logger.error(f"Websocket subscription failed: {e}. Reconnecting...", exc_info=True)
+            await asyncio.sleep(self._poll_interval)
+
+    async def _handle_log(self, raw_log: Dict[str, Any]):
+        """Decodes a subscribed log and hands it to the processor without blocking the event loop."""
+        if raw_log.get('removed'):
+            self.logger.warning(f"Log in transaction {raw_log['transactionHash'].hex()} was removed by a chain reorg. Ignoring.")
+            return
+        if raw_log['blockNumber'] <= self.last_processed_block or self._is_log_processed(raw_log):
+            return # Already covered by the catch-up scan or handled before a reconnect
+
+        event = self._tokens_locked_event.process_log(raw_log)
+        self.logger.info(f"Found 'TokensLocked' event in transaction {event['transactionHash'].hex()} at block {event['blockNumber']}.")
+        # Run on the default executor: process_events may itself submit work to self._pool
+        await asyncio.get_running_loop().run_in_executor(None, self.event_processor.process_events, [event], self._pool)
+        # Other logs from the same block may still arrive, so only the previous block is complete.
+        # The log's own position lets a later catch-up scan of that block skip it.
+        self.last_processed_log = (event['blockNumber'], event['logIndex'])
+        self.last_processed_block = max(self.last_processed_block, event['blockNumber'] - 1)
+        # Live events arrive one at a time, so persist each immediately rather than on the throttle
+        self._save_state(force=True)
+
+    def _is_log_processed(self, raw_log: Dict[str, Any]) -> bool:
+        """Returns True if the log is at or before the last individually handled log."""
+        return self.last_processed_log is not None and (raw_log['blockNumber'], raw_log['logIndex']) <= self.last_processed_log
+
+    def _catch_up(self):
+        """Scans blocks between the saved state and the current head over HTTP."""
+        latest_block = self.source_connector.get_latest_block_number()
+        if latest_block is None:
+            raise ConnectionError("Cannot determine the source chain head for catch-up.")
+        while self.last_processed_block < latest_block and not self._stop.is_set():
+            if self._scan_next_range(latest_block) is None:
+                raise ConnectionError(f"Catch-up scan failed after block {self.last_processed_block}.")
+
+    def _scan_next_range(self, latest_block: int) -> Optional[int]:
+        """
+        Scans the next batch of blocks after `last_processed_block`, up to `latest_block`.
+
+        Returns:
+            Optional[int]: The number of events found, or None if the range could not be scanned.
+        """
+        from_block = self.last_processed_block + 1
+        to_block = min(latest_block, from_block + self._current_batch - 1)
+
+        self.logger.info(f"Scanning for 'TokensLocked' events from block {from_block} to {to_block}...")
+        event_count = self._process_block_range(from_block, to_block)
+        self._adjust_batch_size(event_count)
+        if event_count is not None:
+            self.last_processed_block = to_block
+            self._save_state()
+        return event_count
+
+    def _sleep_until_next_poll(self, started_at: float):
+        """Sleeps for whatever remains of the poll interval since `started_at` (a `time.monotonic()` value)."""
+        elapsed = time.monotonic() - started_at
+        time.sleep(max(0.0, self._poll_interval - elapsed))
+
+    def _adjust_batch_size(self, event_count: Optional[int]):
+        """
+        Grows the scan window while ranges come back empty and shrinks it when a range
+        is dense or failed (`event_count` is None), keeping eth_getLogs responses small.
+        """
+        if event_count is None or event_count > self._dense_batch_events:
+            self._current_batch = max(self._current_batch // 2, self._min_batch)
+        elif event_count == 0:
+            self._current_batch = min(self._current_batch * 2, self._max_batch)
 
-    def _process_block_range(self, from_block: int, to_block: int):
-        """Scans a range of blocks for relevant events and processes them."""
+    def _process_block_range(self, from_block: int, to_block: int) -> Optional[int]:
+        """
+        Scans a range of blocks for relevant events and processes them.
+
+        Returns:
+            Optional[int]: The number of events found, or None if the range could not be scanned.
+        """
         if not self.source_bridge_contract:
             self.logger.error("Source bridge contract not initialized. Skipping block processing.")
-            return
+            return 0
         try:
-            event_filter = self.source_bridge_contract.events.TokensLocked.create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            events = event_filter.get_all_entries()
+            raw_logs = self.source_connector.web3.eth.get_logs({
+                'address': self._log_addr,
+                'topics': [self._topic0],
+                'fromBlock': from_block,
+                'toBlock': to_block
+            })
+            events = [self._tokens_locked_event.process_log(raw_log) for raw_log in raw_logs if not self._is_log_processed(raw_log)]
 
             if not events:
-                self.logger.debug(f"No 'TokensLocked' events found in blocks {from_block}-{to_block}.")
-                return
+                self.logger.debug("No 'TokensLocked' events found in blocks %d-%d.", from_block, to_block)
+                return 0
 
             for event in events:
                 self.logger.info(f"Found 'TokensLocked' event in transaction {event['transactionHash'].hex()} at block {event['blockNumber']}.")
-                self.event_processor.process_event(event)
+            self.event_processor.process_events(events, self._pool)
+            return len(events)
 
         except BlockNotFound:
             self.logger.warning(f"Block range [{from_block}-{to_block}] not found. This might be due to a chain reorg. Will retry.")
             # In a reorg, we might need to roll back self.last_processed_block. 
             # For this simulation, we'll just pause and retry.
-            time.sleep(self.config['listener_settings']['poll_interval_seconds'])
+            time.sleep(self._poll_interval)
         except Exception as e:
             self.logger.error(f"Error fetching events for blocks {from_block}-{to_block}: {e}")
+        return None
 
 
 class EventProcessor:
@@ -271,15 +490,76 @@ class EventProcessor:
             dest_chain_config['bridge_contract_address'],
             BRIDGE_CONTRACT_ABI
         )
+
+        # Reuse pooled keep-alive connections for gas oracle requests
+        self._http = requests.Session()
+        self._http.headers.update({'Accept': 'application/json'})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        # (monotonic timestamp, gas price in wei) of the last successful lookup
+        self._gas_cache: Tuple[float, int] = (0.0, 0)
+        self._gas_cache_ttl = 10.0
+
         self.relayer_account = self.dest_connector.web3.eth.account.from_key(dest_chain_config['relayer_private_key']) if self.dest_connector.web3 else None
         self.logger.info(f"Relayer configured with address: {self.relayer_account.address if self.relayer_account else 'N/A'}")
 
-    def process_event(self, event: Dict[str, Any]):
-        """Processes a single 'TokensLocked' event by simulating an 'unlockTokens' transaction."""
+        # Static transaction fields, fetched once instead of per event
+        self._unlock_fn = self.dest_bridge_contract.functions.unlockTokens if self.dest_bridge_contract else None
+        self._chain_id: Optional[int] = None
+        self._nonce: Optional[int] = None
+        if self.relayer_account and self.dest_connector.web3:
+            try:
+                self._chain_id = self.dest_connector.web3.eth.chain_id
+                self._nonce = self._fetch_pending_nonce()
+            except Exception as e:
+                self.logger.warning(f"Could not prefetch chain id and relayer nonce ({e}). Will retry on first event.")
+
+    def _fetch_pending_nonce(self) -> int:
+        """Returns the relayer's next nonce according to the node, including pending transactions."""
+        return self.dest_connector.web3.eth.get_transaction_count(self.relayer_account.address, 'pending')
+
+    def process_events(self, events: List[Dict[str, Any]], executor: ThreadPoolExecutor):
+        """
+        Processes a batch of 'TokensLocked' events concurrently on `executor`.
+
+        Nonces and the gas price are assigned up front on the calling thread, so the
+        workers share no mutable state. If any event fails, the local nonce counter is
+        resynced from the node once the whole batch has finished. Batches must not
+        be processed concurrently with each other.
+        """
         if not self.dest_bridge_contract or not self.relayer_account or not self.dest_connector.web3:
-            self.logger.error("Destination chain components are not initialized. Cannot process event.")
+            self.logger.error("Destination chain components are not initialized. Cannot process events.")
             return
-        
+        try:
+            if self._chain_id is None:
+                self._chain_id = self.dest_connector.web3.eth.chain_id
+            if self._nonce is None:
+                self._nonce = self._fetch_pending_nonce()
+            gas_price = self._get_gas_price()
+        except Exception as e:
+            self.logger.error(f"Failed to prepare transactions for {len(events)} event(s): {e}", exc_info=True)
+            return
+
+        first_nonce = self._nonce
+        self._nonce += len(events)
+        nonces = range(first_nonce, first_nonce + len(events))
+        if len(events) == 1:
+            results = [self.process_event(events[0], nonces[0], gas_price)]
+        else:
+            results = list(executor.map(self.process_event, events, nonces, [gas_price] * len(events)))
+
+        if not all(results):
+            # Nonces reserved for failed events were never used; resync on the next batch.
+            self._nonce = None
+
+    def process_event(self, event: Dict[str, Any], tx_nonce: int, gas_price: int) -> bool:
+        """
+        Processes a single 'TokensLocked' event by simulating an 'unlockTokens' transaction.
+
+        Returns:
+            bool: True if the transaction was built and signed, False on failure.
+        """
         try:
             event_args = event['args']
             recipient = event_args['from'] # In this simple model, the locker is the recipient on the other side
@@ -292,18 +572,17 @@ class EventProcessor:
             # In a real system, you would build, sign, and send the transaction.
             # Here, we simulate this process.
 
-            w3 = self.dest_connector.web3
-            
             # 1. Build the transaction
-            tx_data = self.dest_bridge_contract.functions.unlockTokens(
+            tx_data = self._unlock_fn(
                 recipient,
                 amount,
                 nonce
             ).build_transaction({
                 'from': self.relayer_account.address,
-                'nonce': w3.eth.get_transaction_count(self.relayer_account.address),
+                'nonce': tx_nonce,
                 'gas': 200000, # A fixed gas limit for simulation
-                'gasPrice': self._get_gas_price()
+                'gasPrice': gas_price,
+                'chainId': self._chain_id
             })
 
             # 2. Sign the transaction
@@ -312,28 +591,43 @@ class EventProcessor:
             # 3. (SIMULATED) Send the transaction
             self.logger.info(f"[SIMULATION] Would send transaction to unlock tokens. Tx hash: {signed_tx.hash.hex()}")
             # In a real implementation:
-            # tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            # receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+            # tx_hash = self.dest_connector.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            # receipt = self.dest_connector.web3.eth.wait_for_transaction_receipt(tx_hash)
             # self.logger.info(f"Transaction sent successfully! Receipt: {receipt}")
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to process event {event['transactionHash'].hex()}: {e}", exc_info=True)
+            return False
 
     def _get_gas_price(self) -> int:
-        """Fetches a suitable gas price. Falls back from external API to node's suggestion."""
+        """
+        Fetches a suitable gas price. Falls back from external API to node's suggestion.
+
+        The result is reused for `_gas_cache_ttl` seconds so that a batch of events
+        costs a single lookup.
+        """
+        now = time.monotonic()
+        ts, cached_price = self._gas_cache
+        if now - ts < self._gas_cache_ttl:
+            return cached_price
+
         # Example of using the 'requests' library for an external dependency
         try:
             # This is a placeholder for a real gas oracle API
-            response = requests.get('https://api.gasoracle.io/v1/price', params={'apiKey': self.config['api_keys']['gas_oracle_api']})
+            response = self._http.get('https://api.gasoracle.io/v1/price', params={'apiKey': self.config['api_keys']['gas_oracle_api']}, timeout=3)
             response.raise_for_status()
             gas_price_gwei = response.json()['fast']
-            self.logger.debug(f"Fetched gas price from API: {gas_price_gwei} Gwei")
-            return Web3.to_wei(gas_price_gwei, 'gwei')
+            self.logger.debug("Fetched gas price from API: %s Gwei", gas_price_gwei)
+            gas_price = Web3.to_wei(gas_price_gwei, 'gwei')
         except Exception as e:
             self.logger.warning(f"Could not fetch gas price from external API ({e}). Falling back to node's suggestion.")
-            if self.dest_connector.web3:
-                return self.dest_connector.web3.eth.gas_price
-            return Web3.to_wei(20, 'gwei') # Hardcoded fallback
+            if not self.dest_connector.web3:
+                return Web3.to_wei(20, 'gwei') # Hardcoded fallback
+            gas_price = self.dest_connector.web3.eth.gas_price
+
+        self._gas_cache = (now, gas_price)
+        return gas_price
 
 if __name__ == '__main__':
     listener = EventListener(CONFIG)